@@ -5,245 +5,542 @@ This script sets /V and /AS without updating appearances, letting PDF viewer han
 """
 
 import sys
+import os
 import json
 import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
 import pikepdf
 from pikepdf import Pdf, Name, String
 
+logger = logging.getLogger(__name__)
+
+# orjson parses/serializes several times faster than stdlib json; fall
+# back silently when it is not installed
+try:
+    import orjson
+
+    def _json_loads(s):
+        return orjson.loads(s)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_loads(s):
+        return json.loads(s)
+
+    def _json_dumps(obj):
+        return json.dumps(obj)
+
+# Name objects cross the pikepdf C++ boundary on construction; build the
+# ones used in per-field loops once at import time
+NAME_TX = Name("/Tx")
+NAME_BTN = Name("/Btn")
+NAME_YES = Name("/Yes")
+NAME_OFF = Name("/Off")
+NAME_WIDGET = Name("/Widget")
+NAME_T = Name("/T")
+NAME_FT = Name("/FT")
+NAME_FF = Name("/Ff")
+NAME_V = Name("/V")
+NAME_AS = Name("/AS")
+NAME_AP = Name("/AP")
+NAME_N = Name("/N")
+NAME_KIDS = Name("/Kids")
+NAME_PARENT = Name("/Parent")
+NAME_ANNOTS = Name("/Annots")
+NAME_SUBTYPE = Name("/Subtype")
+
+# Common button export values, pre-built so typical radio fills skip the
+# Name constructor entirely
+_NAME_CACHE = {"/Yes": NAME_YES, "/Off": NAME_OFF, "/On": Name("/On"),
+               "/1": Name("/1"), "/2": Name("/2"), "/3": Name("/3")}
+
+# Tokens treated as "checked" - includes the spreadsheet-style markers
+# 'checked' and 'x' alongside the usual boolean spellings
+_TRUTHY = frozenset({"1", "true", "on", "yes", "y", "t", "checked", "x"})
+
 def str_to_bool(v):
     """Convert value to boolean"""
-    if isinstance(v, bool):
-        return v
-    if v is None:
+    # Dispatch on type first: bools and None are identity checks, numbers
+    # are truthiness - only genuine strings pay the strip/lower pass
+    if v is True:
+        return True
+    if v is False or v is None:
         return False
-    v_str = str(v).strip().lower()
-    return v_str in {"1", "true", "on", "yes", "y", "t"}
+    if isinstance(v, (int, float)):
+        return bool(v)
+    v_str = (v if type(v) is str else str(v)).strip().lower()
+    return v_str in _TRUTHY
 
 def is_radio(field_dict):
     """Check if field is a radio button"""
-    ff = int(field_dict.get("/Ff", 0) or 0)
+    ff = int(field_dict.get(NAME_FF, 0) or 0)
     return (ff & 0x8000) != 0
 
+def field_kind(field, ft):
+    """Classify a terminal field once, so fills never re-parse /FT or /Ff"""
+    if ft == NAME_TX:
+        return 'text'
+    if ft == NAME_BTN:
+        return 'radio' if is_radio(field) else 'checkbox'
+    return 'other'
+
 def collect_fields(root_fields):
-    """Build a map of full field name -> field dict"""
+    """Build a map of full field name -> (field dict, kind)"""
     result = {}
-    
-    def walk(field, prefix=""):
-        fname_obj = field.get("/T")
-        fname = str(fname_obj) if fname_obj is not None else None
-        ft = field.get("/FT")
-        full = f"{prefix}.{fname}" if prefix and fname else (fname or prefix)
-        
-        kids = field.get("/Kids")
-        if ft is not None:
-            if full:
-                result[full] = field
-        
+
+    # Iterative walk: deep field trees would pay a Python frame per node
+    # (and could hit the recursion limit) with a recursive version. Kids
+    # are pushed in reverse so popping keeps the recursion's depth-first
+    # pre-order - callers rely on it as document order.
+    # The prefix travels as a tuple of components; the dotted name is only
+    # joined at terminal fields, so structural nodes allocate no strings.
+    stack = [(f, ()) for f in reversed(root_fields)]
+    while stack:
+        field, parts = stack.pop()
+        fname_obj = field.get(NAME_T)
+        if fname_obj is not None:
+            parts = parts + (str(fname_obj),)
+
+        # Nodes with no name anywhere above them can never store a field,
+        # so don't even ask for their /FT
+        if parts:
+            ft = field.get(NAME_FT)
+            if ft is not None:
+                # Interned so repeated fills of one template in a process
+                # (batch mode) share the same key objects and compare by
+                # pointer
+                result[sys.intern(".".join(parts))] = (field, field_kind(field, ft))
+
+        kids = field.get(NAME_KIDS)
         if kids:
-            next_prefix = full or prefix
-            for kid in kids:
-                walk(kid, next_prefix)
-    
-    for f in root_fields:
-        walk(f, "")
-    
+            for kid in reversed(kids):
+                stack.append((kid, parts))
+
     return result
 
-def widgets_for_field(pdf: Pdf, field: dict):
-    """Find widget annotations belonging to a field"""
-    widgets = []
+def build_widget_index(pdf: Pdf):
+    """Map parent field objgen -> widget annotations, in one page scan"""
+    index = {}
     
     for page in pdf.pages:
-        annots = page.get("/Annots")
+        annots = page.get(NAME_ANNOTS)
         if not annots:
             continue
         
         for annot in annots:
-            try:
-                if annot.get("/Subtype") != Name("/Widget"):
-                    continue
-                parent = annot.get("/Parent")
-                if parent is field:
-                    widgets.append(annot)
-            except Exception:
+            # Non-dictionary entries are malformed; a cheap type check beats
+            # setting up an exception handler per annotation
+            if not isinstance(annot, pikepdf.Dictionary):
                 continue
+            if annot.get(NAME_SUBTYPE) != NAME_WIDGET:
+                continue
+            parent = annot.get(NAME_PARENT)
+            # (0, 0) means a direct object - no stable identity to key on
+            if parent is not None and parent.objgen != (0, 0):
+                index.setdefault(parent.objgen, []).append(annot)
     
-    if not widgets:
-        kids = field.get("/Kids")
-        if kids:
-            for kid in kids:
-                try:
-                    if kid.get("/Subtype") == Name("/Widget"):
-                        widgets.append(kid)
-                except Exception:
-                    continue
+    return index
+
+def widgets_for_field(widget_index: dict, field: dict):
+    """Find widget annotations belonging to a field"""
+    widgets = widget_index.get(field.objgen)
+    if widgets:
+        return widgets
+    
+    # Fallback: /Kids widgets that carry no /Parent backpointer
+    widgets = []
+    kids = field.get(NAME_KIDS)
+    if kids:
+        for kid in kids:
+            if isinstance(kid, pikepdf.Dictionary) and kid.get(NAME_SUBTYPE) == NAME_WIDGET:
+                widgets.append(kid)
     
     return widgets
 
-def fill_pdf(template_path: str, output_path: str, fields: dict, list_fields: bool = False):
-    """Fill PDF form fields - set values only, preserve template appearances"""
-    pdf = Pdf.open(template_path)
-    
+def _fill_text(widget_index: dict, field_dict: dict, value) -> bool:
+    """Set /V on a text field, preserving the template appearance/fonts"""
+    # pikepdf.String serializes non-ASCII text as UTF-16BE with BOM itself
+    field_dict[NAME_V] = String(str(value))
+    return True
+
+def _fill_radio(widget_index: dict, field_dict: dict, value) -> bool:
+    """Set /V and widget /AS on a radio group by export value"""
+    widgets = widgets_for_field(widget_index, field_dict)
+
+    if not widgets:
+        return False
+
+    value_str = str(value).strip().casefold().lstrip("/")
+
+    # Resolve every export value once into {normalized: (widget, key)} and
+    # match with a single lookup, instead of re-walking /AP -> /N keys per
+    # comparison; first widget wins on duplicate export values, as before
+    choices = {}
+    for w in widgets:
+        ap = w.get(NAME_AP)
+        if not ap:
+            continue
+        apN = ap.get(NAME_N)
+        if not apN:
+            continue
+        try:
+            for k in apN.keys():
+                choices.setdefault(k[1:].casefold(), (w, k))
+        except Exception:
+            continue
+
+    hit = choices.get(value_str)
+    if hit is None:
+        return False
+    found_widget, found_name = hit
+
+    # apN.keys() yields Python strings; build the Name once (cached for
+    # common export values) and share it between /V and the matching
+    # widget's /AS so both are real Names
+    on_name = _NAME_CACHE.get(found_name) or Name(found_name)
+    field_dict[NAME_V] = on_name
+    for ww in widgets:
+        ww[NAME_AS] = on_name if ww is found_widget else NAME_OFF
+    return True
+
+def _fill_checkbox(widget_index: dict, field_dict: dict, value) -> bool:
+    """Set /V and widget /AS on a checkbox: /Yes or /Off based on value"""
+    widgets = widgets_for_field(widget_index, field_dict)
+
+    if not widgets:
+        return False
+
+    state = NAME_YES if str_to_bool(value) else NAME_OFF
+    field_dict[NAME_V] = state
+    for ww in widgets:
+        ww[NAME_AS] = state
+    return True
+
+def _fill_default(widget_index: dict, field_dict: dict, value) -> bool:
+    """Fallback for other field types: store the value as a string"""
+    field_dict[NAME_V] = String(str(value))
+    return True
+
+# Dispatch on the kind precomputed by collect_fields - fills never go back
+# to the pikepdf object to re-read /FT or /Ff
+_HANDLERS = {'text': _fill_text, 'radio': _fill_radio, 'checkbox': _fill_checkbox}
+
+@lru_cache(maxsize=8)
+def _template_bytes(path: str, mtime: float) -> bytes:
+    """Template file contents, keyed on mtime so edits invalidate the cache"""
+    return Path(path).read_bytes()
+
+def open_template(template_path: str) -> Pdf:
+    """Open a template PDF from memory
+
+    One sequential read beats qpdf's many small seeks on slow or
+    network-mounted storage, and repeat fills of the same template in one
+    process (batch mode) reuse the cached bytes.
+    """
+    try:
+        mtime = os.path.getmtime(template_path)
+    except OSError:
+        return Pdf.open(template_path)
+    return Pdf.open(BytesIO(_template_bytes(str(template_path), mtime)))
+
+def _fill_pdf_inplace(pdf: Pdf, fields: dict, list_fields: bool = False):
+    """Fill an already-open Pdf in place and return the result dict
+
+    Split out from fill_pdf so long-running callers can reuse a parsed
+    template (reopened from cached bytes) without paying CLI plumbing.
+    Does not save or close the Pdf.
+    """
     acro = pdf.Root.get("/AcroForm")
     if not acro:
-        pdf.save(output_path)
-        pdf.close()
         return {'success': False, 'error': 'No AcroForm found'}
     
     root_fields = acro.get("/Fields", [])
     field_map = collect_fields(root_fields)
+    # Case-folded index built once so case-insensitive misses are O(1);
+    # setdefault keeps the first match in collection order when names
+    # collide case-insensitively, like the linear scan it replaced
+    field_map_ci = {}
+    for k, v in field_map.items():
+        field_map_ci.setdefault(k.lower(), (k, v))
     
     if list_fields:
-        field_names = list(field_map.keys())
-        pdf.close()
-        return {'success': True, 'field_names': field_names}
+        return {'success': True, 'field_names': list(field_map)}
     
     filled = 0
     skipped = []
-    
+
+    # One page scan up front; every button fill afterwards is a dict lookup
+    # instead of an O(pages x annots) rescan
+    widget_index = build_widget_index(pdf)
+
+    # Empty/None values are skips by definition - drop them up front so the
+    # fill loop body never branches on them
+    fields = {k: v for k, v in fields.items() if v is not None and v != ''}
+
     # DO NOT set /NeedAppearances or update appearances
     # Just set /V and /AS, let PDF viewer handle display
-    
-    for raw_name, value in fields.items():
-        if value is None or value == '':
-            continue
-        
+
+    # Fill in document order (the order collect_fields found the fields)
+    # so qpdf resolves neighbouring objects instead of seeking around the
+    # file; names without an exact match come last
+    ordered = [(n, fields[n]) for n in field_map if n in fields]
+    if len(ordered) < len(fields):
+        ordered += [(n, v) for n, v in fields.items() if n not in field_map]
+
+    for raw_name, value in ordered:
         field_name = raw_name
-        field_dict = field_map.get(field_name)
+        entry = field_map.get(field_name)
         
-        if not field_dict:
-            low = field_name.lower()
-            for k, v in field_map.items():
-                if str(k).lower() == low:
-                    field_name, field_dict = k, v
-                    break
+        if entry is None:
+            hit = field_map_ci.get(field_name.lower())
+            if hit:
+                field_name, entry = hit
         
-        if not field_dict:
+        if entry is None:
             skipped.append(raw_name)
             continue
         
-        ft = field_dict.get("/FT")
-        
-        if ft == Name("/Tx"):
-            # Text field: set /V only, preserve template appearance/fonts
-            field_dict["/V"] = String("" if value is None else str(value))
-            filled += 1
-            continue
-        
-        if ft == Name("/Btn"):
-            widgets = widgets_for_field(pdf, field_dict)
-            
-            if not widgets:
-                skipped.append(raw_name)
-                continue
-            
-            if is_radio(field_dict):
-                # Radio: find widget with matching export value
-                value_str = str(value).strip().lower().lstrip("/")
-                found_widget = None
-                found_name = None
-                
-                for w in widgets:
-                    ap = w.get("/AP")
-                    if not ap:
-                        continue
-                    apN = ap.get("/N")
-                    if not apN:
-                        continue
-                    try:
-                        keys = list(apN.keys())
-                        for k in keys:
-                            if str(k)[1:].lower() == value_str:
-                                found_widget = w
-                                found_name = k
-                                break
-                        if found_widget:
-                            break
-                    except Exception:
-                        continue
-                
-                if found_widget and found_name:
-                    field_dict["/V"] = found_name
-                    for ww in widgets:
-                        ww["/AS"] = found_name if ww is found_widget else Name("/Off")
-                    filled += 1
-                else:
-                    skipped.append(raw_name)
-                continue
-            
-            # Checkbox: use /Yes or /Off based on value
-            on_state = Name("/Yes")
-            off_state = Name("/Off")
-            
-            if str_to_bool(value):
-                field_dict["/V"] = on_state
-                for ww in widgets:
-                    ww["/AS"] = on_state
-            else:
-                field_dict["/V"] = off_state
-                for ww in widgets:
-                    ww["/AS"] = off_state
-            
+        field_dict, kind = entry
+        handler = _HANDLERS.get(kind, _fill_default)
+        if handler(widget_index, field_dict, value):
             filled += 1
-            continue
-        
-        # Other field types
-        field_dict["/V"] = String("" if value is None else str(value))
-        filled += 1
-    
-    pdf.save(output_path, compress_streams=True)
-    pdf.close()
-    
-    output_size = Path(output_path).stat().st_size
+        else:
+            skipped.append(raw_name)
     
     return {
         'success': True,
         'filled_count': filled,
         'skipped_count': len(skipped),
         'skipped_fields': skipped,
-        'total_fields': len(field_map),
-        'output_size': output_size
+        'total_fields': len(field_map)
     }
 
+def save_pdf(pdf: Pdf, output_path: str, optimize: bool = False) -> int:
+    """Save a filled Pdf, returning the number of bytes written
+
+    The default is a pure pass-through: existing streams are copied
+    verbatim (decode level none, no compression or re-flate) and the
+    template's object-stream layout is preserved, since a fill touches
+    zero content streams and recompressing embedded CJK fonts costs far
+    more CPU than the fill itself. optimize=True trades save time for a
+    smaller file by compressing streams and regenerating object streams.
+    A large write buffer keeps big outputs from degrading into many small
+    write() syscalls, and fh.tell() reports the size without a stat()
+    round trip.
+    """
+    if optimize:
+        object_stream_mode = pikepdf.ObjectStreamMode.generate
+        compress = True
+    else:
+        object_stream_mode = pikepdf.ObjectStreamMode.preserve
+        compress = False
+    # A fill never touches content streams or XMP, so skip qpdf's
+    # optional normalization passes on the way out as well
+    with open(output_path, 'wb', buffering=8 << 20) as fh:
+        pdf.save(fh,
+                 compress_streams=compress,
+                 object_stream_mode=object_stream_mode,
+                 stream_decode_level=pikepdf.StreamDecodeLevel.none,
+                 recompress_flate=False,
+                 normalize_content=False,
+                 fix_metadata_version=False,
+                 linearize=False)
+        return fh.tell()
+
+def fill_pdf(template_path: str, output_path: str, fields: dict, list_fields: bool = False,
+             optimize_output: bool = False):
+    """Fill PDF form fields - set values only, preserve template appearances"""
+    pdf = open_template(template_path)
+    try:
+        result = _fill_pdf_inplace(pdf, fields, list_fields)
+        
+        if list_fields:
+            return result
+        
+        if not result.get('success'):
+            # Keep the historical contract: callers expect an output file
+            # even when the template has no AcroForm
+            save_pdf(pdf, output_path, optimize_output)
+            return result
+        
+        result['output_size'] = save_pdf(pdf, output_path, optimize_output)
+        return result
+    finally:
+        pdf.close()
+
+def _form_state(pdf: Pdf) -> list:
+    """Snapshot every field /V and widget /AS so a fill can be undone"""
+    state = []
+    acro = pdf.Root.get("/AcroForm")
+    if not acro:
+        return state
+    field_map = collect_fields(acro.get("/Fields", []))
+    widget_index = build_widget_index(pdf)
+    for field_dict, _kind in field_map.values():
+        state.append((field_dict, NAME_V, field_dict.get(NAME_V)))
+        for w in widgets_for_field(widget_index, field_dict):
+            state.append((w, NAME_AS, w.get(NAME_AS)))
+    return state
+
+def _restore_form_state(state: list):
+    for obj, key, original in state:
+        if original is None:
+            if key in obj:
+                del obj[key]
+        else:
+            obj[key] = original
+
+def fill_many(template_path: str, jobs: list, optimize_output: bool = False) -> list:
+    """Fill several outputs from one parsed template
+
+    Parses the template a single time and reuses the in-memory Pdf for
+    every job, so qpdf's parse cost is amortized across outputs. The fill
+    handlers only ever touch field /V and widget /AS entries, so those
+    are snapshotted up front and restored between jobs instead of
+    re-opening the template. Jobs are {output, fields} dicts; results
+    come back in job order and echo the output path.
+    """
+    pdf = open_template(template_path)
+    try:
+        state = _form_state(pdf)
+        results = []
+        for job in jobs:
+            output = None
+            try:
+                output = job.get('output')
+                result = _fill_pdf_inplace(pdf, job.get('fields') or {})
+                result['output_size'] = save_pdf(pdf, output, optimize_output)
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            result['output'] = output
+            results.append(result)
+            _restore_form_state(state)
+        return results
+    finally:
+        pdf.close()
+
+def _fill_job(job: dict, optimize_output: bool = False) -> dict:
+    """Run one batch entry; never raises so pool results stay ordered"""
+    # A malformed entry (not a dict, missing keys) must produce an error
+    # result like any failed fill, not an exception - one raise inside
+    # executor.map would discard every other job's result
+    output = None
+    try:
+        output = job.get('output')
+        result = fill_pdf(job['template'], output, job.get('fields') or {},
+                          optimize_output=optimize_output)
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    result['output'] = output
+    return result
+
+def fill_batch(jobs: list, workers: int = None, optimize_output: bool = False) -> list:
+    """Fill several independent PDFs, in parallel when it pays off"""
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 6)
+    workers = min(workers, len(jobs))
+    
+    # partial stays picklable, so the flag reaches worker processes
+    job_fn = partial(_fill_job, optimize_output=optimize_output)
+    
+    # Process startup costs more than a single fill - stay serial then
+    if workers <= 1 or len(jobs) == 1:
+        return [job_fn(job) for job in jobs]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(job_fn, jobs))
+
 def main():
     parser = argparse.ArgumentParser(description='Fill PDF form using pikepdf - set values only')
     parser.add_argument('template_path', help='Path to template PDF')
     parser.add_argument('output_path', help='Path to output PDF')
-    parser.add_argument('--fields', required=True, help='JSON string of field_name:value pairs')
+    parser.add_argument('--fields',
+                        help='JSON dict of field_name:value pairs, or a JSON list of '
+                             '{template, output, fields} jobs for batch mode')
+    parser.add_argument('--batch', metavar='JOBS_JSON',
+                        help='Path to a JSON list of {output, fields} jobs all filled '
+                             'from template_path (parses the template once)')
     parser.add_argument('--list-fields', action='store_true', help='List field names and exit')
+    parser.add_argument('--optimize-output', action='store_true',
+                        help='Compress streams on save (slower, smaller file)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for batch mode (default: CPU count, capped at 6)')
+    parser.add_argument('--verbose', action='store_true', help='Print progress diagnostics to stderr')
     
     args = parser.parse_args()
     
+    # Diagnostics go to stderr via logging; stdout stays reserved for the
+    # JSON result so callers can parse it without filtering
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(message)s',
+        stream=sys.stderr,
+    )
+    
     if args.list_fields:
         result = fill_pdf(args.template_path, args.output_path, {}, list_fields=True)
-        print(json.dumps(result))
+        print(_json_dumps(result))
         sys.exit(0 if result.get('success') else 1)
     
+    if args.batch:
+        try:
+            jobs = _json_loads(Path(args.batch).read_text())
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ Error reading batch jobs: {e}")
+            sys.exit(1)
+        if not isinstance(jobs, list) or not all(isinstance(j, dict) for j in jobs):
+            logger.error("❌ Error: batch jobs must be a JSON list of {output, fields} objects")
+            sys.exit(1)
+        results = fill_many(args.template_path, jobs, optimize_output=args.optimize_output)
+        ok = all(r.get('success') for r in results)
+        print(_json_dumps({'success': ok, 'results': results}))
+        sys.exit(0 if ok else 1)
+    
+    if args.fields is None:
+        parser.error('--fields is required unless --batch is given')
+    
     try:
-        fields = json.loads(args.fields)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error parsing fields JSON: {e}", file=sys.stderr)
+        fields = _json_loads(args.fields)
+    except ValueError as e:
+        logger.error(f"❌ Error parsing fields JSON: {e}")
         sys.exit(1)
     
-    print(f"📝 Opening template: {args.template_path}")
+    if isinstance(fields, list):
+        # Batch mode: each job carries its own template/output; the
+        # positional paths are ignored
+        results = fill_batch(fields, args.workers, optimize_output=args.optimize_output)
+        ok = all(r.get('success') for r in results)
+        print(_json_dumps({'success': ok, 'results': results}))
+        sys.exit(0 if ok else 1)
+    
+    logger.info(f"📝 Opening template: {args.template_path}")
     
     try:
-        result = fill_pdf(args.template_path, args.output_path, fields)
+        result = fill_pdf(args.template_path, args.output_path, fields,
+                          optimize_output=args.optimize_output)
         
         if result.get('success'):
-            print(f"✅ Filled {result['filled_count']} fields (skipped {result['skipped_count']})")
-            print(f"💾 Saving to: {args.output_path}")
-            print(f"✅ PDF created successfully ({result['output_size']} bytes)")
-            print(json.dumps(result))
+            logger.info(f"✅ Filled {result['filled_count']} fields (skipped {result['skipped_count']})")
+            logger.info(f"💾 Saved to: {args.output_path} ({result['output_size']} bytes)")
+            print(_json_dumps(result))
             sys.exit(0)
         else:
-            print(f"❌ Error: {result.get('error', 'Unknown error')}", file=sys.stderr)
+            logger.error(f"❌ Error: {result.get('error', 'Unknown error')}")
             sys.exit(1)
     except Exception as e:
-        print(f"❌ Error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        logger.error(f"❌ Error: {e}")
+        # Full tracebacks are slow to format and noisy in pipelines;
+        # the message above is enough unless someone is debugging.
+        # Imported lazily: traceback drags in linecache/tokenize, which is
+        # startup weight every spawned CLI run would otherwise pay
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 if __name__ == '__main__':